@@ -25,6 +25,16 @@ class LLMConfig(BaseModel):
     fallback_model: str = Field(
         default="gpt-4o-mini", description="The fallback model to use for the LLM"
     )
+    max_concurrency: int = Field(
+        default=10,
+        description="The maximum number of agent runs to execute concurrently",
+        ge=1,
+    )
+    max_connections: int = Field(
+        default=32,
+        description="The maximum number of pooled HTTP connections to the LLM API",
+        ge=1,
+    )
 
 
 class LLMConfigMiddleware(BaseModel):
@@ -93,3 +103,9 @@ Example flow:
 
 You are to use the tools to answer the user's question OR convert text from one unit to another.
 """
+
+
+BATCH_PROMPT = """
+You are a helpful assistant that converts values between units.
+Answer with the converted value only, formatted as: "X [unit1] is equal to Y [unit2]"
+"""
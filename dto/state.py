@@ -1,6 +1,9 @@
+import operator
+
 from pydantic import BaseModel, Field
-from typing import Sequence, Annotated
+from typing import Sequence, Annotated, NotRequired
 from datetime import datetime
+from langchain.agents.middleware import AgentState as MiddlewareAgentState
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
@@ -19,11 +22,11 @@ class AgentState(BaseModel):
         add_messages=True,
     )
 
-    # Tool tracking
-    tool_calls_made: list[str] = Field(
+    # Tool tracking (reducers append/sum updates instead of replacing them)
+    tool_calls_made: Annotated[list[str], operator.add] = Field(
         default_factory=list, description="The tools that have been called"
     )
-    tool_call_count: int = Field(
+    tool_call_count: Annotated[int, operator.add] = Field(
         default=0, description="The number of tools that have been called"
     )
     current_tool: str | None = Field(
@@ -56,3 +59,10 @@ class AgentState(BaseModel):
 
     # Flexible metadata
     metadata: dict = Field(default_factory=dict, description="The metadata")
+
+
+class ToolTrackingState(MiddlewareAgentState):
+    """Agent state extended with the tool tracking fields written by middleware"""
+
+    tool_calls_made: NotRequired[Annotated[list[str], operator.add]]
+    tool_call_count: NotRequired[Annotated[int, operator.add]]
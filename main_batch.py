@@ -0,0 +1,126 @@
+import json
+import logging
+import time
+
+from dotenv import load_dotenv
+
+from config import BATCH_PROMPT, LLM_CONFIG
+from main import TEST_QUESTIONS, get_tools
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Seconds between batch status checks; batches can take up to the 24h window
+POLL_INTERVAL = 30
+
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def build_batch_requests(questions: list[str]) -> list[dict]:
+    """One /v1/chat/completions request body per question, without tools"""
+    return [
+        {
+            "custom_id": f"question-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": LLM_CONFIG.model,
+                "temperature": LLM_CONFIG.temperature,
+                "max_completion_tokens": LLM_CONFIG.max_tokens,
+                "messages": [
+                    {"role": "system", "content": BATCH_PROMPT},
+                    {"role": "user", "content": question},
+                ],
+            },
+        }
+        for i, question in enumerate(questions)
+    ]
+
+
+def _parse_record(record: dict) -> str:
+    """Answer text for one line of a batch output or error file"""
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        return f"Error: {record.get('error') or response.get('body')}"
+    return response["body"]["choices"][0]["message"]["content"]
+
+
+def run_batch(questions: list[str]) -> dict[str, str]:
+    """Submit questions through the OpenAI Batch API and wait for the answers
+
+    Returns a mapping of every question to its answer; requests that failed, or
+    never ran because the batch expired or was cancelled, map to an
+    "Error: ..." string.
+    """
+    from openai import OpenAI
+
+    client = OpenAI()
+    requests = build_batch_requests(questions)
+    payload = "\n".join(json.dumps(request) for request in requests).encode()
+
+    input_file = client.files.create(
+        file=("batch_requests.jsonl", payload), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info("Created batch %s for %d questions", batch.id, len(questions))
+
+    while batch.status not in _TERMINAL_STATUSES:
+        time.sleep(POLL_INTERVAL)
+        batch = client.batches.retrieve(batch.id)
+        logger.info("Batch %s status: %s", batch.id, batch.status)
+
+    # A failed batch was rejected before any request ran; expired and cancelled
+    # batches still carry the results of the requests that did run
+    if batch.status == "failed":
+        raise RuntimeError(f"Batch {batch.id} failed: {batch.errors}")
+
+    questions_by_id = {
+        request["custom_id"]: question for request, question in zip(requests, questions)
+    }
+    answers = {}
+    # Successful requests land in the output file, failed ones in the error file
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if file_id is None:
+            continue
+        for line in client.files.content(file_id).text.splitlines():
+            record = json.loads(line)
+            answers[questions_by_id[record["custom_id"]]] = _parse_record(record)
+
+    for question in questions:
+        answers.setdefault(question, f"Error: no result (batch {batch.status})")
+    return answers
+
+
+def main():
+    """Non-interactive variant of main.py that trades latency for batch pricing"""
+    from utils.pre_router import route_question
+
+    # Resolve what we can locally; only the rest is worth a batch request
+    tools_by_name = {tool.name: tool for tool in get_tools()}
+    routed = {q: route_question(q, tools_by_name) for q in TEST_QUESTIONS}
+    batch_questions = [q for q in TEST_QUESTIONS if routed[q] is None]
+
+    answers = {q: routed[q][1] for q in TEST_QUESTIONS if routed[q] is not None}
+    if batch_questions:
+        answers.update(run_batch(batch_questions))
+
+    print("=" * 60)
+    print(f"Answered {len(TEST_QUESTIONS)} test questions...")
+    print("=" * 60)
+
+    for i, question in enumerate(TEST_QUESTIONS, 1):
+        print(f"\n[Test {i}/{len(TEST_QUESTIONS)}]")
+        print(f"Question: {question}")
+        print("-" * 60)
+        print(f"Answer: {answers[question]}")
+        print("-" * 60)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
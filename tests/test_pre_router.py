@@ -0,0 +1,79 @@
+import pytest
+
+from tools import (
+    CelsiusToFahrenheitTool,
+    FahrenheitToCelsiusTool,
+    FeetToMetersTool,
+    MetersToFeetTool,
+)
+from utils.pre_router import route_question
+
+TOOLS_BY_NAME = {
+    tool.name: tool
+    for tool in (
+        FeetToMetersTool(),
+        MetersToFeetTool(),
+        CelsiusToFahrenheitTool(),
+        FahrenheitToCelsiusTool(),
+    )
+}
+
+
+@pytest.mark.parametrize(
+    ("question", "expected"),
+    [
+        (
+            "How many meters are in 185 feet?",
+            ("feet_to_meters", "185 feet is equal to 56.388 meters"),
+        ),
+        (
+            "Convert 10 feet to meters",
+            ("feet_to_meters", "10 feet is equal to 3.048 meters"),
+        ),
+        (
+            "What is 5280 feet in meters?",
+            ("feet_to_meters", "5280 feet is equal to 1609.344 meters"),
+        ),
+        (
+            "How many feet are in 100 meters?",
+            ("meters_to_feet", "100 meters is equal to 328.084 feet"),
+        ),
+        (
+            "Convert 10 Feet into meters.",
+            ("feet_to_meters", "10 feet is equal to 3.048 meters"),
+        ),
+        (
+            "Convert .5 feet to meters",
+            ("feet_to_meters", ".5 feet is equal to 0.1524 meters"),
+        ),
+        (
+            "What is 25 degrees Celsius in Fahrenheit?",
+            ("celsius_to_fahrenheit", "25 celsius is equal to 77.0 fahrenheit"),
+        ),
+        (
+            "Convert -40 Fahrenheit to Celsius",
+            ("fahrenheit_to_celsius", "-40 fahrenheit is equal to -40.0 celsius"),
+        ),
+    ],
+)
+def test_routes_plain_conversions(question, expected):
+    assert route_question(question, TOOLS_BY_NAME) == expected
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "How cold is freezing in Fahrenheit?",
+        "Is 100 feet taller than a meters stick?",
+        "A room is 12 feet wide; what is that in meters and inches?",
+        "Convert 10 feet to meters and inches",
+        "What is 5 feet in meters squared?",
+        "Convert 10 feet to meters per second",
+        "Convert 1,000 feet to meters",
+        "Convert 10 feet to 3 meters",
+        "Convert 10 feet to feet",
+        "Convert 10 miles to meters",
+    ],
+)
+def test_leaves_other_questions_to_the_agent(question):
+    assert route_question(question, TOOLS_BY_NAME) is None
@@ -0,0 +1,11 @@
+from tools.feet_meters import FeetToMetersTool
+from tools.meters_feet import MetersToFeetTool
+from tools.celsius_fahrenheit import CelsiusToFahrenheitTool
+from tools.fahrenheit_celsius import FahrenheitToCelsiusTool
+
+__all__ = [
+    "FeetToMetersTool",
+    "MetersToFeetTool",
+    "CelsiusToFahrenheitTool",
+    "FahrenheitToCelsiusTool",
+]
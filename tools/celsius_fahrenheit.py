@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 
@@ -8,12 +9,16 @@ except Exception:
     ArgsSchema = type[BaseModel]
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _celsius_to_fahrenheit(celsius: float) -> float:
+    return (celsius * 9 / 5) + 32
+
+
 class CelsiusToFahrenheit(BaseModel):
-    celsius: float | None = Field(description="The temperature in Celsius")
+    celsius: float = Field(description="Celsius value")
 
 
 class CelsiusToFahrenheitResponse(BaseModel):
@@ -21,7 +26,9 @@ class CelsiusToFahrenheitResponse(BaseModel):
     input_unit: str | None = Field(description="The input unit")
     output_value: float | None = Field(description="The output value")
     output_unit: str | None = Field(description="The output unit")
-    timestamp: datetime | None = Field(description="The timestamp of the conversion")
+    timestamp: datetime | None = Field(
+        default_factory=datetime.now, description="The timestamp of the conversion"
+    )
 
 
 class CelsiusToFahrenheitTool(BaseTool):
@@ -31,40 +38,28 @@ class CelsiusToFahrenheitTool(BaseTool):
     description: str = "Convert Celsius to fahrenheit"
     args_schema: ArgsSchema = CelsiusToFahrenheit
 
-    def _run(self, **kwargs: dict) -> CelsiusToFahrenheitResponse:
-        validated_input = CelsiusToFahrenheit(**kwargs)
-        celsius = validated_input.celsius
+    def _run(self, celsius: float) -> CelsiusToFahrenheitResponse:
+        logger.info("Converting Celsius to fahrenheit: %s", celsius)
 
-        logger.info(f"Converting Celsius to fahrenheit: {celsius}")
-        if celsius is None:
-            raise ValueError("Celsius is required")
+        fahrenheit = _celsius_to_fahrenheit(celsius)
 
-        fahrenheit = (celsius * 9 / 5) + 32
-
-        logger.info(f"fahrenheit: {fahrenheit}")
+        logger.info("fahrenheit: %s", fahrenheit)
         return CelsiusToFahrenheitResponse(
             input_value=celsius,
             input_unit="celsius",
             output_value=fahrenheit,
             output_unit="fahrenheit",
-            timestamp=datetime.now(),
         )
 
-    async def _arun(self, **kwargs: dict) -> CelsiusToFahrenheitResponse:
-        validated_input = CelsiusToFahrenheit(**kwargs)
-        celsius = validated_input.celsius
-
-        logger.info(f"Converting Celsius to fahrenheit: {celsius}")
-        if celsius is None:
-            raise ValueError("Celsius is required")
+    async def _arun(self, celsius: float) -> CelsiusToFahrenheitResponse:
+        logger.info("Converting Celsius to fahrenheit: %s", celsius)
 
-        fahrenheit = (celsius * 9 / 5) + 32
+        fahrenheit = _celsius_to_fahrenheit(celsius)
 
-        logger.info(f"fahrenheit: {fahrenheit}")
+        logger.info("fahrenheit: %s", fahrenheit)
         return CelsiusToFahrenheitResponse(
             input_value=celsius,
             input_unit="celsius",
             output_value=fahrenheit,
             output_unit="fahrenheit",
-            timestamp=datetime.now(),
         )
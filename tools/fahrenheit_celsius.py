@@ -1,14 +1,19 @@
 from datetime import datetime
+from functools import lru_cache
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _fahrenheit_to_celsius(fahrenheit: float) -> float:
+    return (fahrenheit - 32) * 5 / 9
+
+
 class FahrenheitToCelsius(BaseModel):
-    fahrenheit: float | None = Field(description="The temperature in Fahrenheit")
+    fahrenheit: float = Field(description="Fahrenheit value")
 
 
 class FahrenheitToCelsiusResponse(BaseModel):
@@ -16,7 +21,9 @@ class FahrenheitToCelsiusResponse(BaseModel):
     input_unit: str | None = Field(description="The input unit")
     output_value: float | None = Field(description="The output value")
     output_unit: str | None = Field(description="The output unit")
-    timestamp: datetime | None = Field(description="The timestamp of the conversion")
+    timestamp: datetime | None = Field(
+        default_factory=datetime.now, description="The timestamp of the conversion"
+    )
 
 
 class FahrenheitToCelsiusTool(BaseTool):
@@ -26,42 +33,28 @@ class FahrenheitToCelsiusTool(BaseTool):
     description: str = "Convert Fahrenheit to Celsius"
     args_schema: type[BaseModel] = FahrenheitToCelsius
 
-    def _run(self, **kwargs: dict) -> float:
-        validated_input = FahrenheitToCelsius(**kwargs)
-        fahrenheit = validated_input.fahrenheit
-
-        logger.info(f"Converting Fahrenheit to Celsius: {fahrenheit}")
+    def _run(self, fahrenheit: float) -> FahrenheitToCelsiusResponse:
+        logger.info("Converting Fahrenheit to Celsius: %s", fahrenheit)
 
-        if fahrenheit is None:
-            raise ValueError("Fahrenheit is required")
+        celsius = _fahrenheit_to_celsius(fahrenheit)
 
-        celsius = (fahrenheit - 32) * 5 / 9
-
-        logger.info(f"Celsius: {celsius}")
+        logger.info("Celsius: %s", celsius)
         return FahrenheitToCelsiusResponse(
             input_value=fahrenheit,
             input_unit="fahrenheit",
             output_value=celsius,
             output_unit="celsius",
-            timestamp=datetime.now(),
         )
 
-    async def _arun(self, **kwargs: dict) -> float:
-        validated_input = FahrenheitToCelsius(**kwargs)
-        fahrenheit = validated_input.fahrenheit
-
-        logger.info(f"Converting Fahrenheit to Celsius: {fahrenheit}")
-
-        if fahrenheit is None:
-            raise ValueError("Fahrenheit is required")
+    async def _arun(self, fahrenheit: float) -> FahrenheitToCelsiusResponse:
+        logger.info("Converting Fahrenheit to Celsius: %s", fahrenheit)
 
-        celsius = (fahrenheit - 32) * 5 / 9
+        celsius = _fahrenheit_to_celsius(fahrenheit)
 
-        logger.info(f"Celsius: {celsius}")
+        logger.info("Celsius: %s", celsius)
         return FahrenheitToCelsiusResponse(
             input_value=fahrenheit,
             input_unit="fahrenheit",
             output_value=celsius,
             output_unit="celsius",
-            timestamp=datetime.now(),
         )
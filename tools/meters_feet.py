@@ -1,20 +1,36 @@
+import time
 from datetime import datetime
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_FEET_PER_METER = 3.28084
+_METERS_PER_KILOMETER = 1000.0
+# The expressed_in_* adjustments folded into the base factor, so each
+# conversion is a single multiply
+_FEET_PER_METER_EXPRESSED_IN_KILOMETERS = _FEET_PER_METER / 1.60934
+_METERS_PER_KILOMETER_EXPRESSED_IN_METERS = _METERS_PER_KILOMETER / _FEET_PER_METER
+
+# (kilometers given, expressed_in_* flag for that input) ->
+# (factor, input unit, output unit)
+_CONVERSIONS = {
+    (False, False): (_FEET_PER_METER, "meters", "feet"),
+    (False, True): (_FEET_PER_METER_EXPRESSED_IN_KILOMETERS, "meters", "feet"),
+    (True, False): (_METERS_PER_KILOMETER, "kilometers", "meters"),
+    (True, True): (_METERS_PER_KILOMETER_EXPRESSED_IN_METERS, "kilometers", "meters"),
+}
+
 
 class MetersToFeet(BaseModel):
-    meters: float | None = Field(description="The length in meters")
-    kilometers: float | None = Field(description="The length in kilometers")
-    expressed_in_kilometers: bool | None = Field(
-        description="If True, the length is expressed in kilometers, if False, the length is expressed in meters"
+    meters: float | None = Field(default=None, description="Meters value")
+    kilometers: float | None = Field(default=None, description="Kilometers value")
+    expressed_in_kilometers: bool = Field(
+        default=False, description="True if expressed in kilometers"
     )
-    expressed_in_meters: bool | None = Field(
-        description="If True, the length is expressed in meters, if False, the length is expressed in kilometers"
+    expressed_in_meters: bool = Field(
+        default=False, description="True if expressed in meters"
     )
 
 
@@ -23,7 +39,45 @@ class MetersToFeetResponse(BaseModel):
     input_unit: str | None = Field(description="The input unit")
     output_value: float | None = Field(description="The output value")
     output_unit: str | None = Field(description="The output unit")
-    timestamp: datetime | None = Field(description="The timestamp of the conversion")
+    # Only the clock is read per call; the datetime is built when accessed
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns,
+        repr=False,
+        description="The timestamp of the conversion, in nanoseconds since the epoch",
+    )
+
+    @computed_field(description="The timestamp of the conversion")
+    @property
+    def timestamp(self) -> datetime:
+        seconds, nanoseconds = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
+
+def _convert(
+    meters: float | None,
+    kilometers: float | None,
+    expressed_in_kilometers: bool,
+    expressed_in_meters: bool,
+) -> MetersToFeetResponse:
+    logger.info("Converting Meters to Feet: %s", meters)
+
+    # meters wins when both are given
+    is_kilometers = meters is None
+    value = kilometers if is_kilometers else meters
+    if value is None:
+        raise ValueError("Meters or Kilometers is required")
+
+    flag = expressed_in_meters if is_kilometers else expressed_in_kilometers
+    factor, input_unit, output_unit = _CONVERSIONS[is_kilometers, bool(flag)]
+    output_value = value * factor
+
+    logger.info("%s: %s", output_unit.capitalize(), output_value)
+    return MetersToFeetResponse(
+        input_value=value,
+        input_unit=input_unit,
+        output_value=output_value,
+        output_unit=output_unit,
+    )
 
 
 class MetersToFeetTool(BaseTool):
@@ -35,90 +89,23 @@ class MetersToFeetTool(BaseTool):
 
     def _run(
         self,
-        **kwargs: dict,
-    ) -> float:
-        validated_input = MetersToFeet(**kwargs)
-        meters = validated_input.meters
-        kilometers = validated_input.kilometers
-        expressed_in_kilometers = validated_input.expressed_in_kilometers
-        expressed_in_meters = validated_input.expressed_in_meters
-
-        logger.info(f"Converting Meters to Feet: {meters}")
-
-        if meters is not None:
-            feet = meters * 3.28084
-
-            if expressed_in_kilometers:
-                feet = feet / 1.60934
-
-            logger.info(f"Feet: {feet}")
-            return MetersToFeetResponse(
-                input_value=meters,
-                input_unit="meters",
-                output_value=feet,
-                output_unit="feet",
-                timestamp=datetime.now(),
-            )
-
-        elif kilometers is not None:
-            meters = kilometers * 1000
-
-            if expressed_in_meters:
-                meters = meters / 3.28084
-
-            logger.info(f"Meters: {meters}")
-            return MetersToFeetResponse(
-                input_value=kilometers,
-                input_unit="kilometers",
-                output_value=meters,
-                output_unit="meters",
-                timestamp=datetime.now(),
-            )
-
-        else:
-            raise ValueError("Meters or Kilometers is required")
+        meters: float | None = None,
+        kilometers: float | None = None,
+        expressed_in_kilometers: bool = False,
+        expressed_in_meters: bool = False,
+    ) -> MetersToFeetResponse:
+        return _convert(
+            meters, kilometers, expressed_in_kilometers, expressed_in_meters
+        )
 
     async def _arun(
         self,
-        **kwargs: dict,
-    ) -> float:
-        validated_input = MetersToFeet(**kwargs)
-        meters = validated_input.meters
-        kilometers = validated_input.kilometers
-        expressed_in_kilometers = validated_input.expressed_in_kilometers
-        expressed_in_meters = validated_input.expressed_in_meters
-
-        logger.info(f"Converting Meters to Feet: {meters}")
-
-        if meters is not None:
-            feet = meters * 3.28084
-
-            if expressed_in_kilometers:
-                feet = feet / 1.60934
-
-            logger.info(f"Feet: {feet}")
-            return MetersToFeetResponse(
-                input_value=meters,
-                input_unit="meters",
-                output_value=feet,
-                output_unit="feet",
-                timestamp=datetime.now(),
-            )
-
-        elif kilometers is not None:
-            meters = kilometers * 1000
-
-            if expressed_in_meters:
-                meters = meters / 3.28084
-
-            logger.info(f"Meters: {meters}")
-            return MetersToFeetResponse(
-                input_value=kilometers,
-                input_unit="kilometers",
-                output_value=meters,
-                output_unit="meters",
-                timestamp=datetime.now(),
-            )
-
-        else:
-            raise ValueError("Meters or Kilometers is required")
+        meters: float | None = None,
+        kilometers: float | None = None,
+        expressed_in_kilometers: bool = False,
+        expressed_in_meters: bool = False,
+    ) -> MetersToFeetResponse:
+        # Pure arithmetic with nothing to await, so this shares the sync path
+        return _convert(
+            meters, kilometers, expressed_in_kilometers, expressed_in_meters
+        )
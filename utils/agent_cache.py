@@ -0,0 +1,44 @@
+from collections import OrderedDict
+from typing import Any
+
+_MAX_CACHED_RESULTS = 256
+
+# normalized question -> agent output, most recently used last
+_results: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+def batch_with_cache(agent, questions: list[str], config: dict) -> list[dict]:
+    """Run questions through `agent.batch`, reusing results for repeated questions
+
+    Questions that normalize to the same text within the call, or that were
+    already answered earlier in the process, are sent to the agent only once.
+    The cache is process-wide, so it assumes one agent configuration per process.
+    """
+    keys = [normalize_question(question) for question in questions]
+
+    # First phrasing of each question that has no cached result yet
+    pending: dict[str, str] = {}
+    for key, question in zip(keys, questions):
+        if key not in _results and key not in pending:
+            pending[key] = question
+
+    inputs = [{"messages": [{"role": "user", "content": q}]} for q in pending.values()]
+    fresh = dict(zip(pending, agent.batch(inputs, config=config)))
+
+    answers = []
+    for key in keys:
+        if key in fresh:
+            answers.append(fresh[key])
+        else:
+            answers.append(_results[key])
+            _results.move_to_end(key)
+
+    _results.update(fresh)
+    while len(_results) > _MAX_CACHED_RESULTS:
+        _results.popitem(last=False)
+
+    return answers
@@ -0,0 +1,32 @@
+from functools import lru_cache
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from config import LLM_CONFIG
+
+
+@lru_cache(maxsize=1)
+def _get_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    # One keep-alive connection pool per process, shared by every ChatOpenAI
+    limits = httpx.Limits(
+        max_connections=LLM_CONFIG.max_connections,
+        max_keepalive_connections=LLM_CONFIG.max_connections,
+    )
+    return httpx.Client(limits=limits), httpx.AsyncClient(limits=limits)
+
+
+@lru_cache(maxsize=4)
+def get_chat_openai(
+    model: str, temperature: float, max_tokens: int, timeout: int
+) -> ChatOpenAI:
+    """Return a process-wide ChatOpenAI instance for the given settings"""
+    http_client, http_async_client = _get_http_clients()
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        http_client=http_client,
+        http_async_client=http_async_client,
+    )
@@ -1,16 +1,53 @@
-from langchain.agents.middleware import wrap_tool_call, before_model
-from langchain_core.messages import ToolMessage
+import logging
+
+from langchain.agents.middleware import wrap_tool_call, before_model, after_agent
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from dto.state import AgentResponse, ToolTrackingState
+
+logger = logging.getLogger(__name__)
 
 
 @before_model
 def log_messages(state, runtime):
-    print(f"About to call model with {len(state['messages'])} messages")
-    return None  # No changes
+    logger.debug("About to call model with %d messages", len(state["messages"]))
 
 
 @wrap_tool_call
 def handle_errors(request, handler):
     try:
         return handler(request)  # Execute tool normally
-    except Exception as e:
-        return ToolMessage(content=f"Error: {e}")  # Return error instead
+    except (ValueError, TypeError, KeyError) as e:
+        # Bad tool input (including pydantic ValidationError); anything else is
+        # a real failure and propagates
+        return ToolMessage(  # Return error instead
+            content=f"Error: {e.__class__.__name__}: {e}",
+            tool_call_id=request.tool_call["id"],
+        )
+
+
+@after_agent(state_schema=ToolTrackingState)
+def track_tool_calls(state, runtime):
+    """Record the tools called by the model during this run"""
+    # This run's messages start after the latest user message; the final
+    # message is the structured response, so every AIMessage has to be checked
+    run_messages = []
+    for message in reversed(state["messages"]):
+        if isinstance(message, HumanMessage):
+            break
+        run_messages.append(message)
+
+    tool_names = [
+        tool_call["name"]
+        for message in reversed(run_messages)
+        if isinstance(message, AIMessage)
+        for tool_call in message.tool_calls
+        # ToolStrategy returns the structured response as a call to this tool
+        if tool_call["name"] != AgentResponse.__name__
+    ]
+    if tool_names:
+        # The state reducers append/sum these onto the existing values
+        return {
+            "tool_calls_made": tool_names,
+            "tool_call_count": len(tool_names),
+        }
@@ -0,0 +1,79 @@
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain.tools import BaseTool
+
+_UNITS = r"feet|meters|celsius|fahrenheit"
+# A number can't start right after a digit, "." or "," (".5" or "1,000" never
+# match on their trailing digits)
+_NUMBER_PATTERN = r"(?<![\d.,])-?(?:\d+(?:\.\d+)?|\.\d+)"
+_VALUE = rf"(?P<value>{_NUMBER_PATTERN})"
+_FROM = rf"(?:degrees\s+)?(?P<from_unit>{_UNITS})\b"
+_TO = rf"(?:degrees\s+)?(?P<to_unit>{_UNITS})\b"
+# Only closing punctuation may follow the conversion clause ("meters squared",
+# "meters per second" are not plain conversions)
+_END = r"\s*[?.!]*\s*$"
+_NUMBER = re.compile(_NUMBER_PATTERN)
+# The target unit has to sit in the conversion clause itself:
+# "<value> <unit> to|in|into <unit>" or "how many <unit> are in <value> <unit>"
+_CONVERSION_PATTERNS = (
+    re.compile(rf"{_VALUE}\s*{_FROM}\s+(?:to|in|into)\s+{_TO}{_END}", re.IGNORECASE),
+    re.compile(
+        rf"\bhow\s+many\s+{_TO}\s+(?:are\s+)?in\s+{_VALUE}\s*{_FROM}{_END}",
+        re.IGNORECASE,
+    ),
+)
+# Any unit word, supported or not; a question may only name its two units
+_ANY_UNIT = re.compile(
+    r"\b(?:feet|foot|meters?|metres?|kilometers?|kilometres?|centimeters?"
+    r"|centimetres?|millimeters?|millimetres?|inch(?:es)?|yards?|miles?"
+    r"|celsius|fahrenheit|kelvin)\b",
+    re.IGNORECASE,
+)
+
+# (from unit, to unit) -> (tool name, tool input argument)
+_ROUTES = {
+    ("feet", "meters"): ("feet_to_meters", "feet"),
+    ("meters", "feet"): ("meters_to_feet", "meters"),
+    ("celsius", "fahrenheit"): ("celsius_to_fahrenheit", "celsius"),
+    ("fahrenheit", "celsius"): ("fahrenheit_to_celsius", "fahrenheit"),
+}
+
+
+def route_question(
+    question: str, tools_by_name: dict[str, "BaseTool"]
+) -> tuple[str, str] | None:
+    """Answer a plain numeric conversion question by calling its tool directly
+
+    Returns the `(tool name, answer)` pair, or None when the question is not an
+    unambiguous "<number> <unit> to <unit>" (or "how many <unit> are in
+    <number> <unit>") conversion naming no other units, and needs the agent.
+    """
+    if len(_NUMBER.findall(question)) != 1:
+        return None
+    if len(_ANY_UNIT.findall(question)) != 2:
+        return None
+
+    match = next(
+        (m for pattern in _CONVERSION_PATTERNS if (m := pattern.search(question))),
+        None,
+    )
+    if match is None:
+        return None
+
+    value = match.group("value")
+    from_unit = match.group("from_unit").lower()
+    to_unit = match.group("to_unit").lower()
+
+    route = _ROUTES.get((from_unit, to_unit))
+    if route is None or route[0] not in tools_by_name:
+        return None
+
+    tool_name, argument = route
+    response = tools_by_name[tool_name].invoke({argument: float(value)})
+    answer = (
+        f"{value} {response.input_unit} is equal to "
+        f"{round(response.output_value, 4)} {response.output_unit}"
+    )
+    return tool_name, answer